@@ -74,11 +74,14 @@ geometry_source = """#version 150
         m_translate[3][1] = center.y;
         m_translate[3][2] = center.z;
 
+        float r = radians(-geo_rotation[0]);
+        float c = cos(r);
+        float s = sin(r);
         mat4 m_rotation = mat4(1.0);
-        m_rotation[0][0] =  cos(radians(-geo_rotation[0])); 
-        m_rotation[0][1] =  sin(radians(-geo_rotation[0]));
-        m_rotation[1][0] = -sin(radians(-geo_rotation[0]));
-        m_rotation[1][1] =  cos(radians(-geo_rotation[0]));
+        m_rotation[0][0] =  c;
+        m_rotation[0][1] =  s;
+        m_rotation[1][0] = -s;
+        m_rotation[1][1] =  c;
 
         mat4 m_scale = mat4(1.0);
         m_scale[0][0] = geo_scale[0].x;
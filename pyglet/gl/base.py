@@ -367,12 +367,13 @@ class Context:
 
         .. versionadded:: 2.0.10
         """
-        if program := self._cached_programs.get(str(sources)):
+        key = tuple((src, srctype) for src, srctype in sources)
+        if program := self._cached_programs.get(key):
             return program
 
         shaders = (pyglet.graphics.shader.Shader(src, srctype) for (src, srctype) in sources)
         program = pyglet.graphics.shader.ShaderProgram(*shaders)
-        self._cached_programs[str(sources)] = program
+        self._cached_programs[key] = program
 
         return program
 
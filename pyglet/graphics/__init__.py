@@ -299,7 +299,8 @@ class Batch:
 
         # Find domain given formats, indices and mode
         domain_map = self.group_map[group]
-        key = (indexed, mode, program, str(attributes))
+        # All other attribute metadata is introspected from the program, so only formats can differ
+        key = (indexed, mode, program, tuple((name, meta['format']) for name, meta in attributes.items()))
         try:
             domain = domain_map[key]
         except KeyError:
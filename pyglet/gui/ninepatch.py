@@ -124,45 +124,12 @@ class NinePatch(Sprite):
                     x0, y8, z, x1, y8, z, x2, y8, z, x3, y8, z,
                     x0, y12, z, x1, y12, z, x2, y12, z, x3, y12, z)
 
-    @property
-    def position(self) -> tuple[float, float, float]:
-        """The (x, y, z) coordinates of the NinePatch, as a tuple."""
-        return self._x, self._y, self._z
-
-    @position.setter
-    def position(self, position: tuple[float, float, float]) -> None:
-        self._x, self._y, self._z = position
-        self._vertex_list.translate[:] = position * 16
-
-    @property
-    def x(self) -> float:
-        """X coordinate of the NinePatch."""
-        return self._x
+    def _update_translate(self) -> None:
+        self._vertex_list.translate[:] = (self._x, self._y, self._z) * 16
 
-    @x.setter
-    def x(self, x):
-        self._x = x
-        self._vertex_list.translate[:] = (x, self._y, self._z) * 16
-
-    @property
-    def y(self) -> float:
-        """Y coordinate of the NinePatch."""
-        return self._y
-
-    @y.setter
-    def y(self, y):
-        self._y = y
-        self._vertex_list.translate[:] = (self._x, y, self._z) * 16
-
-    @property
-    def z(self) -> float:
-        """Z coordinate of the NinePatch."""
-        return self._z
-
-    @z.setter
-    def z(self, z):
-        self._z = z
-        self._vertex_list.translate[:] = (self._x, self._y, z) * 16
+    def _update_color(self) -> None:
+        r, g, b = self._rgb
+        self._vertex_list.colors[:] = (r, g, b, int(self._opacity)) * 16
 
     @property
     def rotation(self) -> float:
@@ -175,6 +142,8 @@ class NinePatch(Sprite):
 
     @rotation.setter
     def rotation(self, rotation: float):
+        if rotation == self._rotation:
+            return
         self._rotation = rotation
         self._vertex_list.rotation[:] = (self._rotation,) * 16
 
@@ -218,39 +187,3 @@ class NinePatch(Sprite):
     def height(self, height: float):
         self._height = height
         self._update_position()
-
-    @property
-    def opacity(self) -> int:
-        """Blend opacity.
-
-        This property sets the alpha component of the colour of the NinePatch's
-        vertices.  With the default blend mode (see the constructor), this
-        allows the NinePatch to be drawn with fractional opacity, blending with
-        the background.
-
-        An opacity of 255 (the default) has no effect.  An opacity of 128 will
-        make the NinePatch appear translucent.
-        """
-        return self._opacity
-
-    @opacity.setter
-    def opacity(self, opacity: int):
-        self._opacity = opacity
-        self._vertex_list.colors[:] = (*self._rgb, int(self._opacity)) * 16
-
-    @property
-    def color(self) -> tuple[int, int, int]:
-        """Blend color.
-
-        This property sets the color of the NinePatch's vertices. This allows the
-        NinePatch to be drawn with a color tint.
-
-        The color is specified as an RGB tuple of integers '(red, green, blue)'.
-        Each color component must be in the range 0 (dark) to 255 (saturated).
-        """
-        return self._rgb
-
-    @color.setter
-    def color(self, rgb: tuple[int, int, int]):
-        self._rgb = int(rgb[0]), int(rgb[1]), int(rgb[2])
-        self._vertex_list.colors[:] = (*self._rgb, int(self._opacity)) * 16
@@ -41,6 +41,9 @@ class AbstractAudioPlayer(metaclass=ABCMeta):
         self.player = weakref.proxy(player)
 
         afmt = source.audio_format
+        # Cached, as it is needed on every `work` call; sources set later must share the format.
+        self._bytes_per_second = afmt.bytes_per_second
+
         # How much data should ideally be in memory ready to be played.
         self._buffered_data_ideal_size = max(
             32768,
@@ -100,6 +103,9 @@ class AbstractAudioPlayer(metaclass=ABCMeta):
     def work(self):
         """Ran regularly by the worker thread. This method should fill up
         the player's buffers if required, and dispatch any necessary events.
+
+        May return the time in seconds until the player next needs to be
+        worked on, or ``None`` to leave the interval up to the worker thread.
         """
         # This method is tricky to implement. See "Media manual" in pyglet's
         # development guide.
@@ -197,6 +203,24 @@ class AbstractAudioPlayer(metaclass=ABCMeta):
         while self._events and self._events[0][0] <= until_cursor:
             self._events.popleft()[1].sync_dispatch_to_player(self.player)
 
+    def get_time_until_work(self, play_cursor, refill_cursor=None):
+        """Estimate the time in seconds until the given ``play_cursor``
+        reaches either ``refill_cursor`` or the index of the next
+        :class:`MediaEvent`, whichever comes first.
+
+        Meant to be returned from ``work``. Will return ``None`` if neither
+        ``refill_cursor`` is given nor any events are pending.
+        """
+        next_cursor = refill_cursor
+        if self._events:
+            event_cursor = self._events[0][0] + self._compensated_bytes
+            if next_cursor is None or event_cursor < next_cursor:
+                next_cursor = event_cursor
+
+        if next_cursor is None:
+            return None
+        return max(0, next_cursor - play_cursor) / self._bytes_per_second
+
     def get_audio_time_diff(self, audio_time):
         """Query the difference between the provided time and the high
         level `Player`'s master clock.
@@ -172,7 +172,7 @@ class OpenALAudioPlayer(AbstractAudioPlayer):
     def _update_play_cursor(self) -> None:
         self._play_cursor = self._buffer_cursor + self.alsource.byte_offset
 
-    def work(self) -> None:
+    def work(self) -> Optional[float]:
         self._check_processed_buffers()
         self._update_play_cursor()
         self.dispatch_media_events(self._play_cursor)
@@ -182,7 +182,8 @@ class OpenALAudioPlayer(AbstractAudioPlayer):
                 self._has_underrun = True
                 assert _debug('OpenALAudioPlayer: Dispatching eos')
                 MediaEvent('on_eos').sync_dispatch_to_player(self.player)
-            return
+            # Leave polling for the end of playback to the worker's default interval.
+            return None
 
         refilled = self._maybe_refill()
 
@@ -191,6 +192,9 @@ class OpenALAudioPlayer(AbstractAudioPlayer):
             # source underran and stopped. If it did, restart it.
             self.alsource.play()
 
+        return self.get_time_until_work(
+            self._play_cursor, self._write_cursor - self._buffered_data_comfortable_limit)
+
     def _maybe_refill(self) -> bool:
         if self._pyglet_source_exhausted:
             return False
@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 
 _debug = debug_print('debug_media')
 
+_memmove = ctypes.memmove
+
 
 class PulseAudioDriver(AbstractAudioDriver):
     def __init__(self) -> None:
@@ -124,20 +126,21 @@ class _AudioDataBuffer:
         self.virtual_write_index += d.length
 
     def memmove(self, target_pointer: int, num_bytes: int) -> int:
+        data = self._data
         bytes_written = 0
         bytes_remaining = num_bytes
-        while bytes_remaining > 0 and self._data:
-            cur_audio_data = self._data[0]
+        while bytes_remaining > 0 and data:
+            cur_audio_data = data[0]
             cur_len = cur_audio_data.length - self._first_read_offset
             packet_used = cur_len <= bytes_remaining
             cur_write = min(bytes_remaining, cur_len)
-            ctypes.memmove(target_pointer + bytes_written,
-                           cur_audio_data.pointer + self._first_read_offset,
-                           cur_write)
+            _memmove(target_pointer + bytes_written,
+                     cur_audio_data.pointer + self._first_read_offset,
+                     cur_write)
             bytes_written += cur_write
             bytes_remaining -= cur_write
             if packet_used:
-                self._data.popleft()
+                data.popleft()
                 self._first_read_offset = 0
             else:
                 self._first_read_offset += cur_write
@@ -197,15 +200,30 @@ class PulseAudioPlayer(AbstractAudioPlayer):
         assert _debug(f'PulseAudioPlayer: Write requested, {nbytes}B')
         assert self.source.audio_format.align(nbytes) == nbytes
 
+        # Fast path: Nothing is buffered, so there's no need to fight the work thread
+        # for the lock. Reading `available` is atomic, and should data arrive in the
+        # meantime, `_maybe_write_pending` will pick up the pending bytes anyways.
+        # Writes to `_pending_bytes` are serialized by the PA mainloop lock.
+        if self._audio_data_buffer.available == 0:
+            self._pending_bytes = nbytes
+            self.stream.mainloop.signal()
+            self.driver.worker.notify()
+            return
+
+        unfulfilled = 0
         with self._audio_data_lock:
             if self._audio_data_buffer.available > 0:
                 written = self._write_to_stream(nbytes)
                 if (unfulfilled := nbytes - written) > 0:
                     self._pending_bytes = unfulfilled
             else:
-                self._pending_bytes = nbytes
+                self._pending_bytes = unfulfilled = nbytes
 
         self.stream.mainloop.signal()
+        # PA wants more data than is buffered; have the work thread refill right away
+        # instead of waiting out its nap.
+        if unfulfilled > 0:
+            self.driver.worker.notify()
 
     def _underflow_callback(self, _stream, _userdata) -> None:
         # Called from within PA thread
@@ -215,6 +233,7 @@ class PulseAudioPlayer(AbstractAudioPlayer):
                 MediaEvent('on_eos').sync_dispatch_to_player(self.player)
             self._has_underrun = True
         self.stream.mainloop.signal()
+        self.driver.worker.notify()
 
     def _maybe_fill_audio_data_buffer(self) -> None:
         # PA as opposed to the other backends works on requests which are relatively small (or on a
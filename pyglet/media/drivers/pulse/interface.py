@@ -25,6 +25,9 @@ _SIZE_T_MAX = sys.maxsize*2 + 1
 PA_INVALID_INDEX = _UINT32_MAX
 PA_INVALID_WRITABLE_SIZE = _SIZE_T_MAX
 
+# Null free callback passed to every `pa_stream_write`; no need to recreate it each time.
+_NULL_FREE_CB = pa.pa_free_cb_t(0)
+
 
 def get_uint32_or_none(value: int) -> Optional[int]:
     if value == _UINT32_MAX:
@@ -186,6 +189,12 @@ class PulseAudioContext(PulseAudioMainloopChild):
         self._pa_context = ctx
         self.state = None
 
+        # Operations without a python callback only need to signal the mainloop once
+        # done, so they can all share a callback lump instead of creating a new
+        # ctypes callback each time.
+        self._default_context_success_clump = PulseAudioContextSuccessCallbackLump(self)
+        self._default_stream_success_clump = PulseAudioStreamSuccessCallbackLump(self)
+
         self._set_state_callback(self._state_callback)
 
     def delete(self) -> None:
@@ -203,6 +212,8 @@ class PulseAudioContext(PulseAudioMainloopChild):
                 pa.pa_context_unref(self._pa_context)
 
             self._pa_context = None
+            self._default_context_success_clump = None
+            self._default_stream_success_clump = None
 
     @property
     def is_ready(self) -> bool:
@@ -278,7 +289,7 @@ class PulseAudioContext(PulseAudioMainloopChild):
         """
         cvolume = self._get_cvolume_from_linear(stream, volume)
 
-        clump = PulseAudioContextSuccessCallbackLump(self)
+        clump = self._default_context_success_clump
         return PulseAudioOperation(
             clump,
             pa.pa_context_set_sink_input_volume(
@@ -290,6 +301,18 @@ class PulseAudioContext(PulseAudioMainloopChild):
             ),
         )
 
+    def get_stream_success_clump(
+        self,
+        callback: Optional[PulseAudioContextSuccessCallback] = None,
+    ) -> 'PulseAudioStreamSuccessCallbackLump':
+        """
+        Return a callback lump for a stream operation, reusing a shared one
+        when no callback is given.
+        """
+        if callback is None:
+            return self._default_stream_success_clump
+        return PulseAudioStreamSuccessCallbackLump(self, callback)
+
     def _get_cvolume_from_linear(self, stream: 'PulseAudioStream', volume: float) -> pa.pa_cvolume:
         cvolume = pa.pa_cvolume()
         volume = pa.pa_sw_volume_from_linear(volume)
@@ -525,7 +548,7 @@ class PulseAudioStream(PulseAudioMainloopChild):
         assert _debug(f'PulseAudioStream: writing {length} bytes')
 
         context.check(
-            pa.pa_stream_write(self._pa_stream, data, length, pa.pa_free_cb_t(0), 0, seek_mode)
+            pa.pa_stream_write(self._pa_stream, data, length, _NULL_FREE_CB, 0, seek_mode)
         )
         return length
 
@@ -537,7 +560,7 @@ class PulseAudioStream(PulseAudioMainloopChild):
         assert context is not None
         assert self._pa_stream is not None
 
-        clump = PulseAudioStreamSuccessCallbackLump(context, callback)
+        clump = context.get_stream_success_clump(callback)
         return PulseAudioOperation(
             clump,
             pa.pa_stream_update_timing_info(self._pa_stream, clump.pa_callback, None),
@@ -564,7 +587,7 @@ class PulseAudioStream(PulseAudioMainloopChild):
         assert context is not None
         assert self._pa_stream is not None
 
-        clump = PulseAudioStreamSuccessCallbackLump(context, callback)
+        clump = context.get_stream_success_clump(callback)
         return PulseAudioOperation(
             clump,
             pa.pa_stream_trigger(self._pa_stream, clump.pa_callback, None),
@@ -578,7 +601,7 @@ class PulseAudioStream(PulseAudioMainloopChild):
         assert context is not None
         assert self._pa_stream is not None
 
-        clump = PulseAudioStreamSuccessCallbackLump(context, callback)
+        clump = context.get_stream_success_clump(callback)
         return PulseAudioOperation(
             clump,
             pa.pa_stream_prebuf(self._pa_stream, clump.pa_callback, None),
@@ -592,7 +615,7 @@ class PulseAudioStream(PulseAudioMainloopChild):
         assert context is not None
         assert self._pa_stream is not None
 
-        clump = PulseAudioStreamSuccessCallbackLump(context, callback)
+        clump = context.get_stream_success_clump(callback)
         return PulseAudioOperation(
             clump,
             pa.pa_stream_flush(self._pa_stream, clump.pa_callback, None),
@@ -619,7 +642,7 @@ class PulseAudioStream(PulseAudioMainloopChild):
         assert context is not None
         assert self._pa_stream is not None
 
-        clump = PulseAudioStreamSuccessCallbackLump(context, callback)
+        clump = context.get_stream_success_clump(callback)
         return PulseAudioOperation(
             clump,
             pa.pa_stream_cork(self._pa_stream, pause, clump.pa_callback, None),
@@ -634,7 +657,7 @@ class PulseAudioStream(PulseAudioMainloopChild):
         assert context is not None
         assert self._pa_stream is not None
 
-        clump = PulseAudioStreamSuccessCallbackLump(context, callback)
+        clump = context.get_stream_success_clump(callback)
         return PulseAudioOperation(
             clump,
             pa.pa_stream_update_sample_rate(
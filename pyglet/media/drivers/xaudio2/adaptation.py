@@ -1,7 +1,7 @@
 from collections import deque
+import itertools
 import math
-import threading
-from typing import Deque, Tuple, TYPE_CHECKING
+from typing import Deque, Optional, Tuple, TYPE_CHECKING
 
 from pyglet.media.codecs import AudioData, Source
 from pyglet.media.drivers.base import AbstractAudioDriver, AbstractAudioPlayer, MediaEvent
@@ -16,12 +16,23 @@ if TYPE_CHECKING:
 
 _debug = debug_print('debug_media')
 
+_DEG_TO_RAD = math.pi / 180.0
+
 
 def _convert_coordinates(coordinates: Tuple[float, float, float]) -> Tuple[float, float, float]:
     x, y, z = coordinates
     return x, y, -z
 
 
+def _convert_orientation(
+    forward: Tuple[float, float, float],
+    up: Tuple[float, float, float],
+) -> Tuple[float, float, float, float, float, float]:
+    fx, fy, fz = forward
+    ux, uy, uz = up
+    return fx, fy, -fz, ux, uy, -uz
+
+
 class XAudio2Driver(AbstractAudioDriver):
     def __init__(self) -> None:
         # Listener will be connected by interface.XAudio2Driver constructor
@@ -86,8 +97,8 @@ class XAudio2Listener(AbstractListener):
 
     def _set_orientation(self) -> None:
         if self._xa2_listener is not None:
-            self._xa2_listener.orientation = (_convert_coordinates(self._forward_orientation) +
-                                              _convert_coordinates(self._up_orientation))
+            self._xa2_listener.orientation = _convert_orientation(self._forward_orientation,
+                                                                  self._up_orientation)
 
 
 class XAudio2AudioPlayer(AbstractAudioPlayer):
@@ -97,6 +108,9 @@ class XAudio2AudioPlayer(AbstractAudioPlayer):
         # a singleton object which will only be deleted when the application
         # shuts down. The AudioDriver does not keep a ref to the AudioPlayer.
         self.driver = driver
+        # The interface driver object survives engine resets, only the pyglet driver's
+        # reference to it is dropped once it's deleted.
+        self._xa2_driver = driver._xa2_driver
 
         # Need to cache these because pyglet API allows update separately, but
         # XAudio2 requires both to be set at once.
@@ -117,15 +131,22 @@ class XAudio2AudioPlayer(AbstractAudioPlayer):
         # as the new voice will start at 0.
         self._sample_correction = 0
 
+        # Appended to by the worker thread, popped from by the XAudio2 callback thread.
+        # Deque appends and pops are atomic, so no lock is needed between the two.
         self._audio_data_in_use: Deque['AudioData'] = deque()
         self._pyglet_source_exhausted = False
 
-        # A lock to be held whenever modifying things relating to the in-use audio data.
-        # Ensures that the XAudio2 callbacks will not interfere with the
-        # player operations.
-        self._audio_data_lock = threading.Lock()
+        # Both the worker and the XAudio2 callback may notice the end of the stream at the
+        # same time. Whoever draws the first number off this gets to dispatch `on_eos`.
+        self._eos_claim = itertools.count()
+
+        # Sources may only be swapped out for ones of the same audio format, so these are
+        # safe to keep around instead of going through the source proxy each time.
+        audio_format = source.audio_format
+        self._bytes_per_frame = audio_format.bytes_per_frame
+        self._align_ceil = audio_format.align_ceil
 
-        self._xa2_source_voice = self.driver._xa2_driver.get_source_voice(source.audio_format, self)
+        self._xa2_source_voice = self._xa2_driver.get_source_voice(audio_format, self)
 
     def on_driver_destroy(self) -> None:
         # This is called by an event, so likely not in an application's update.
@@ -164,10 +185,8 @@ class XAudio2AudioPlayer(AbstractAudioPlayer):
             else:
                 pc_advance -= audio_data.length
 
-        self._write_cursor = self._sample_correction
-        for audio_data in self._audio_data_in_use:
-            self._xa2_source_voice.submit_buffer(interface.create_xa2_buffer(audio_data))
-            self._write_cursor += audio_data.length
+        self._xa2_source_voice.submit_audio_data_batch(self._audio_data_in_use)
+        self._write_cursor = self._sample_correction + sum(d.length for d in self._audio_data_in_use)
 
         if self._playing:
             self._xa2_source_voice.play()
@@ -178,6 +197,7 @@ class XAudio2AudioPlayer(AbstractAudioPlayer):
             assert _debug("Xaudio2: Player deleted, driver or voice is gone")
             # Driver was deleted; just break up some references and return
             self.driver = None
+            self._xa2_driver = None
             self._xa2_source_voice = None
             self._audio_data_in_use.clear()
             return
@@ -185,8 +205,9 @@ class XAudio2AudioPlayer(AbstractAudioPlayer):
         assert _debug("XAudio2: Player deleted, returning voice")
 
         self.stop()
-        self.driver._xa2_driver.return_voice(self._xa2_source_voice, self._audio_data_in_use)
+        self._xa2_driver.return_voice(self._xa2_source_voice, self._audio_data_in_use)
         self.driver = None
+        self._xa2_driver = None
         self._xa2_source_voice = None
 
     def play(self) -> None:
@@ -207,7 +228,7 @@ class XAudio2AudioPlayer(AbstractAudioPlayer):
             if self._xa2_source_voice is not None:
                 self.driver.worker.remove(self)
                 # no callback could possibly be running after this lock is released.
-                with self.driver._xa2_driver.lock:
+                with self._xa2_driver.lock:
                     self._xa2_source_voice.stop()
             self._playing = False
 
@@ -220,16 +241,17 @@ class XAudio2AudioPlayer(AbstractAudioPlayer):
         self._write_cursor = 0
         self._sample_correction = 0
         self._pyglet_source_exhausted = False
+        self._eos_claim = itertools.count()
 
         if self._xa2_source_voice is not None:
-            self.driver._xa2_driver.return_voice(self._xa2_source_voice, self._audio_data_in_use)
+            self._xa2_driver.return_voice(self._xa2_source_voice, self._audio_data_in_use)
             self._audio_data_in_use = deque()
             self._get_and_configure_voice()
         else:
             self._audio_data_in_use.clear()
 
     def _get_and_configure_voice(self) -> None:
-        v = self.driver._xa2_driver.get_source_voice(self.source.audio_format, self)
+        v = self._xa2_driver.get_source_voice(self.source.audio_format, self)
         self._xa2_source_voice = v
 
         v.volume = self.player.volume
@@ -240,53 +262,52 @@ class XAudio2AudioPlayer(AbstractAudioPlayer):
             v.cone_orientation = _convert_coordinates(self.player.cone_orientation)
             v.cone_outside_volume = self.player.cone_outer_gain
             self._set_cone_angles()
-            self.driver._xa2_driver.apply3d(v)
+            self._xa2_driver.apply3d(v)
 
     def on_buffer_end(self, buffer_context_ptr: int) -> None:
         # Called from the XAudio2 thread.
         # A buffer stopped being played by the voice, it should by all means be the first one
-        with self._audio_data_lock:
-            assert self._audio_data_in_use
-            self._audio_data_in_use.popleft()
-            # This should cause the AudioData to lose all its references and be gc'd
+        assert self._audio_data_in_use
+        self._audio_data_in_use.popleft()
+        # This should cause the AudioData to lose all its references and be gc'd
 
-            if self._audio_data_in_use:
-                assert _debug(f"Buffer ended, others remain: {len(self._audio_data_in_use)=}")
-                return
+        if self._audio_data_in_use:
+            assert _debug(f"Buffer ended, others remain: {len(self._audio_data_in_use)=}")
+            return
 
-            assert self._xa2_source_voice.buffers_queued == 0
+        # Pairs with `_refill`, which marks the source as exhausted before checking for
+        # remaining data. At least one of the two will see both conditions.
+        if self._pyglet_source_exhausted:
+            # Last buffer ran out naturally, out of AudioData; voice will now fall silent
+            assert _debug("Last buffer ended normally, dispatching eos")
+            self._dispatch_eos()
+        else:
+            # Shouldn't have ran out; supplier is running behind
+            # All we can do is wait; as long as voices are not stopped via `Stop`, they will
+            # immediately continue playing the new buffer once it arrives
+            assert _debug("Last buffer ended normally, source is lagging behind")
 
-            if self._pyglet_source_exhausted:
-                # Last buffer ran out naturally, out of AudioData; voice will now fall silent
-                assert _debug("Last buffer ended normally, dispatching eos")
-                MediaEvent('on_eos').sync_dispatch_to_player(self.player)
-            else:
-                # Shouldn't have ran out; supplier is running behind
-                # All we can do is wait; as long as voices are not stopped via `Stop`, they will
-                # immediately continue playing the new buffer once it arrives
-                assert _debug("Last buffer ended normally, source is lagging behind")
+    def _dispatch_eos(self) -> None:
+        if next(self._eos_claim) == 0:
+            MediaEvent('on_eos').sync_dispatch_to_player(self.player)
 
     def _refill(self, refill_size: int) -> None:
-        """Get one piece of AudioData and submit it to the voice.
-        This method will release the lock around the call to `get_audio_data`,
-        so make sure it's held upon calling.
-        """
+        """Get one piece of AudioData and submit it to the voice."""
         assert _debug(f"XAudio2: Retrieving new buffer of {refill_size}B")
 
-        self._audio_data_lock.release()
         audio_data = self._get_and_compensate_audio_data(refill_size, self._play_cursor)
-        self._audio_data_lock.acquire()
 
         if audio_data is None:
             assert _debug(f"XAudio2: Source is out of data")
             self._pyglet_source_exhausted = True
             if not self._audio_data_in_use:
-                MediaEvent('on_eos').sync_dispatch_to_player(self.player)
+                self._dispatch_eos()
             return
 
-        xa2_buffer = interface.create_xa2_buffer(audio_data)
+        # Append before submitting, the buffer may end as soon as it's submitted.
         self._audio_data_in_use.append(audio_data)
-        self._xa2_source_voice.submit_buffer(xa2_buffer)
+        self._xa2_source_voice.submit_audio_data(audio_data)
+
         assert _debug(f"XAudio2: Submitted buffer of size {audio_data.length}B")
 
         self.append_events(self._write_cursor, audio_data.events)
@@ -297,18 +318,23 @@ class XAudio2AudioPlayer(AbstractAudioPlayer):
         self._play_cursor = (
             self._sample_correction + (
                 (voice.samples_played - voice.samples_played_at_last_recycle) *
-                self.source.audio_format.bytes_per_frame
+                self._bytes_per_frame
             )
         )
 
     def get_play_cursor(self) -> int:
         return self._play_cursor
 
-    def work(self) -> None:
-        with self._audio_data_lock:
-            self._update_play_cursor()
-            self.dispatch_media_events(self._play_cursor)
-            self._maybe_refill()
+    def work(self) -> Optional[float]:
+        # The cursors and events are only touched by the thread calling `work`.
+        self._update_play_cursor()
+        self.dispatch_media_events(self._play_cursor)
+        self._maybe_refill()
+
+        if self._pyglet_source_exhausted:
+            return self.get_time_until_work(self._play_cursor)
+        return self.get_time_until_work(
+            self._play_cursor, self._write_cursor - self._buffered_data_comfortable_limit)
 
     def _maybe_refill(self) -> bool:
         if self._pyglet_source_exhausted:
@@ -322,15 +348,14 @@ class XAudio2AudioPlayer(AbstractAudioPlayer):
         assert _debug(f"Getting more audio data, only {remaining_bytes}B remain")
 
         missing_bytes = self._buffered_data_ideal_size - remaining_bytes
-        self._refill(self.source.audio_format.align_ceil(missing_bytes))
+        self._refill(self._align_ceil(missing_bytes))
         return True
 
     def prefill_audio(self) -> None:
         if self._xa2_source_voice is None:
             return
 
-        with self._audio_data_lock:
-            self._maybe_refill()
+        self._maybe_refill()
 
     def set_volume(self, volume: float) -> None:
         if self._xa2_source_voice is not None:
@@ -370,7 +395,7 @@ class XAudio2AudioPlayer(AbstractAudioPlayer):
     def _set_cone_angles(self) -> None:
         inner = min(self._cone_inner_angle, self._cone_outer_angle)
         outer = max(self._cone_inner_angle, self._cone_outer_angle)
-        self._xa2_source_voice.set_cone_angles(math.radians(inner), math.radians(outer))
+        self._xa2_source_voice.set_cone_angles(inner * _DEG_TO_RAD, outer * _DEG_TO_RAD)
 
     def set_cone_outer_gain(self, cone_outer_gain: float) -> None:
         if self._xa2_source_voice is not None and self._xa2_source_voice.is_emitter:
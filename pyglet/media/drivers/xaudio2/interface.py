@@ -17,9 +17,16 @@ def create_xa2_buffer(audio_data):
     """Creates a XAUDIO2_BUFFER to be used with a source voice.
         Audio data cannot be purged until the source voice has played it; doing so will cause glitches."""
     buff = lib.XAUDIO2_BUFFER()
+    fill_xa2_buffer(buff, audio_data)
+    return buff
+
+
+def fill_xa2_buffer(buff, audio_data):
+    """Point an existing XAUDIO2_BUFFER at the given audio data.
+        XAudio2 copies the buffer struct on submission, so it may be refilled right after. The audio
+        data itself is still not to be purged until the source voice has played it."""
     buff.AudioBytes = audio_data.length
     buff.pAudioData = ctypes.cast(audio_data.pointer, ctypes.POINTER(ctypes.c_char))
-    return buff
 
 
 def create_xa2_waveformat(audio_format):
@@ -153,6 +160,7 @@ class XAudio2Driver:
         self._voice_pool = defaultdict(list)  # Maps voice keys to lists of voices ready to use.
         self._in_use = {}  # All voices currently in use, mapped to their audio player.
         self._resetting_voices = {}  # All resetting voices, mapped to their resetter.
+        self._waveformats = {}  # Maps (channels, sample size, sample rate) to WAVEFORMATEX for voice creation.
 
         self._players = []  # Used for resetting/restoring xaudio2. Stores high-level players to callback.
 
@@ -404,7 +412,10 @@ class XAudio2Driver:
         """Has the driver create a new source voice for the given audio format."""
         voice = lib.IXAudio2SourceVoice()
 
-        wfx_format = create_xa2_waveformat(audio_format)
+        wfx_key = (audio_format.channels, audio_format.sample_size, audio_format.sample_rate)
+        wfx_format = self._waveformats.get(wfx_key)
+        if wfx_format is None:
+            wfx_format = self._waveformats[wfx_key] = create_xa2_waveformat(audio_format)
 
         callback = XAudio2VoiceCallback()
         self._xaudio2.CreateSourceVoice(ctypes.byref(voice),
@@ -420,6 +431,8 @@ class XAudio2Driver:
 class XA2SourceVoice:
     def __init__(self, voice, callback, channel_count, sample_size):
         self._voice_state = lib.XAUDIO2_VOICE_STATE()  # Used for buffer state, will be reused constantly.
+        self._xa2_buffer = lib.XAUDIO2_BUFFER()  # Used for buffer submission, will be reused constantly.
+        self._xa2_buffer_ref = ctypes.byref(self._xa2_buffer)
         self._voice = voice
         self._callback = callback
 
@@ -609,6 +622,21 @@ class XA2SourceVoice:
     def submit_buffer(self, x2_buffer):
         self._voice.SubmitSourceBuffer(ctypes.byref(x2_buffer), None)
 
+    def submit_audio_data(self, audio_data):
+        """Submit the given audio data, reusing this voice's buffer struct.
+        The audio data must be kept alive until the voice is done playing it."""
+        fill_xa2_buffer(self._xa2_buffer, audio_data)
+        self._voice.SubmitSourceBuffer(self._xa2_buffer_ref, None)
+
+    def submit_audio_data_batch(self, audio_datas):
+        """Submit all given audio data in order. See `submit_audio_data`."""
+        buff = self._xa2_buffer
+        buff_ref = self._xa2_buffer_ref
+        submit = self._voice.SubmitSourceBuffer
+        for audio_data in audio_datas:
+            fill_xa2_buffer(buff, audio_data)
+            submit(buff_ref, None)
+
 
 class XAudio2Listener:
     def __init__(self, driver):
@@ -3,7 +3,7 @@ from __future__ import annotations
 import time
 import threading
 
-from typing import TYPE_CHECKING, Set
+from typing import TYPE_CHECKING, Callable, Optional, Set, Tuple
 
 import pyglet
 
@@ -25,7 +25,9 @@ class PlayerWorkerThread(threading.Thread):
     does not block the main thread.
 
     This thread will sleep for a small period betwen updates, but provides a
-    :py:meth:`~notify` method to allow waking it immediately. A :py:meth:`~stop`
+    :py:meth:`~notify` method to allow waking it immediately. Players may
+    return the time in seconds until they next need work from ``work``, which
+    the thread uses to sleep longer or shorter than usual. A :py:meth:`~stop`
     method is provided to terminate the thread, but under normal operation it
     will exit cleanly on interpreter shutdown.
     """
@@ -34,14 +36,24 @@ class PlayerWorkerThread(threading.Thread):
     # time updating the players
     _nap_time = 0.020
 
+    # Bounds for the sleep time when players report how long they can go without work.
+    # Even fully buffered players are visited at least ten times per second.
+    _min_nap_time = 0.005
+    _max_nap_time = 0.100
+
     def __init__(self) -> None:
         super().__init__(daemon=True)
 
-        self._rest_event = threading.Event()
+        # Condition the thread rests on. Set `_notified` while holding it to wake the thread.
+        self._rest_condition = threading.Condition()
+        self._notified = False
         # A lock that should be held as long as consistency of `self.players` is required.
         self._operation_lock = threading.Lock()
         self._stopped = False
         self.players: Set[AbstractAudioPlayer] = set()
+        # Immutable copy of `self.players` for the thread to iterate over, paired with each
+        # player's bound `work` method. Only rebuilt when players are added or removed.
+        self._players_snapshot: Tuple[Tuple[AbstractAudioPlayer, Callable[[], Optional[float]]], ...] = ()
 
     def run(self) -> None:
         if pyglet.options['debug_trace']:
@@ -52,35 +64,56 @@ class PlayerWorkerThread(threading.Thread):
         while True:
             assert _debug(f"PlayerWorkerThread.run: Going to sleep "
                           f"{'indefinitely; no active players' if sleep_time is None else f'for {sleep_time}'}")
-            self._rest_event.wait(sleep_time)
-            self._rest_event.clear()
+            with self._rest_condition:
+                self._rest_condition.wait_for(self._should_wake, sleep_time)
+                self._notified = False
 
             assert _debug(f'PlayerWorkerThread.run: woke up @{time.time()}')
             if self._stopped:
                 break
 
-            with self._operation_lock:
-                if self.players:
-                    sleep_time = self._nap_time
-                    for player in self.players:
-                        player.work()
-                else:
-                    # sleep until a player is added
-                    sleep_time = None
+            players = self._players_snapshot
+            if players:
+                sleep_time = self._max_nap_time
+                for player, work in players:
+                    # Only hold the lock for a single player's work, so `add` and `remove`
+                    # do not have to wait for the entire iteration.
+                    with self._operation_lock:
+                        # The player may have been removed after the snapshot was taken
+                        if player not in self.players:
+                            continue
+                        next_work = work()
+
+                    if next_work is None:
+                        next_work = self._nap_time
+                    if next_work < sleep_time:
+                        sleep_time = next_work
+
+                if sleep_time < self._min_nap_time:
+                    sleep_time = self._min_nap_time
+            else:
+                # sleep until a player is added
+                sleep_time = None
 
         assert _debug(f'PlayerWorkerThread.run: exiting')
 
+    def _should_wake(self) -> bool:
+        # Notifications are of no interest without any players; keep resting until one is
+        # added in that case.
+        return self._stopped or (self._notified and bool(self._players_snapshot))
+
     def stop(self) -> None:
         """Stop the thread and wait for it to terminate.
 
-        The ``stop`` instance variable is set to ``True`` and the rest event
-        is set.  It is the responsibility of the ``run`` method to check
+        The ``stop`` instance variable is set to ``True`` and the rest condition
+        is notified.  It is the responsibility of the ``run`` method to check
         the value of ``_stopped`` after each sleep or wait and to return if
         set.
         """
         assert _debug('PlayerWorkerThread.stop()')
-        self._stopped = True
-        self._rest_event.set()
+        with self._rest_condition:
+            self._stopped = True
+            self._rest_condition.notify()
         try:
             self.join()
         except RuntimeError:
@@ -96,12 +129,15 @@ class PlayerWorkerThread(threading.Thread):
         done with its operation.
         """
         assert _debug('PlayerWorkerThread.notify()')
-        self._rest_event.set()
+        with self._rest_condition:
+            self._notified = True
+            self._rest_condition.notify()
 
     def add(self, player: AbstractAudioPlayer) -> None:
         """Add a player to the PlayerWorkerThread, and call :py:meth:`~notify`.
 
         When a player is added, it's ``work`` method will be called regularly.
+        This call has no effect if the player was already added.
 
         .. note:: Do not call this method from within the thread, as it will deadlock.
         """
@@ -109,7 +145,10 @@ class PlayerWorkerThread(threading.Thread):
         assert _debug('PlayerWorkerThread: player added')
 
         with self._operation_lock:
+            if player in self.players:
+                return
             self.players.add(player)
+            self._update_snapshot()
 
         self.notify()
 
@@ -122,6 +161,11 @@ class PlayerWorkerThread(threading.Thread):
         """
         assert _debug('PlayerWorkerThread: player removed')
 
-        if player in self.players:
-            with self._operation_lock:
-                self.players.remove(player)
+        with self._operation_lock:
+            if player not in self.players:
+                return
+            self.players.remove(player)
+            self._update_snapshot()
+
+    def _update_snapshot(self) -> None:
+        self._players_snapshot = tuple((player, player.work) for player in self.players)
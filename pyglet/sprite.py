@@ -114,10 +114,14 @@ vertex_source: str = """#version 150 core
         m_translate[3][0] = translate.x;
         m_translate[3][1] = translate.y;
         m_translate[3][2] = translate.z;
-        m_rotation[0][0] =  cos(-radians(rotation)); 
-        m_rotation[0][1] =  sin(-radians(rotation));
-        m_rotation[1][0] = -sin(-radians(rotation));
-        m_rotation[1][1] =  cos(-radians(rotation));
+
+        float r = -radians(rotation);
+        float c = cos(r);
+        float s = sin(r);
+        m_rotation[0][0] =  c;
+        m_rotation[0][1] =  s;
+        m_rotation[1][0] = -s;
+        m_rotation[1][1] =  c;
 
         gl_Position = window.projection * window.view * m_translate * m_rotation * m_scale * vec4(position, 1.0);
 
@@ -153,6 +157,12 @@ fragment_array_source: str = """#version 150 core
 """
 
 
+# Two triangles forming the sprite quad
+_QUAD_INDICES = (0, 1, 2, 0, 2, 3)
+# Vertex positions of a hidden sprite
+_HIDDEN_VERTICES = (0,) * 12
+
+
 def get_default_shader() -> ShaderProgram:
     return pyglet.gl.current_context.create_program((vertex_source, 'vertex'),
                                                     (fragment_source, 'fragment'))
@@ -171,6 +181,8 @@ class SpriteGroup(graphics.Group):
     Group, Texture and blend parameters.
     """
 
+    __slots__ = ('texture', 'blend_src', 'blend_dest', 'program')
+
     def __init__(self, texture: Texture, blend_src: int, blend_dest: int,
                  program: ShaderProgram, parent: Group | None = None):
         """Create a sprite group.
@@ -235,6 +247,10 @@ class Sprite(event.EventDispatcher):
     See the module documentation for usage.
     """
 
+    # State with a class-level default is not slotted, so subclasses that do not call
+    # `Sprite.__init__` (such as the MultiTextureSprite examples) can still rely on it.
+    __slots__ = ('_x', '_y', '_z', '_img', '_texture', '_next_dt', '_group', '_subpixel', '_program')
+
     _batch = None
     _animation = None
     _frame_index = 0
@@ -286,6 +302,7 @@ class Sprite(event.EventDispatcher):
         self._y = y
         self._z = z
         self._img = img
+        self._next_dt = None
 
         if isinstance(img, image.Animation):
             self._animation = img
@@ -297,24 +314,29 @@ class Sprite(event.EventDispatcher):
             self._texture = img.get_texture()
 
         self._batch = batch
+        self._program = self._get_program(img)
         self._group = self.group_class(self._texture, blend_src, blend_dest, self.program, group)
         self._subpixel = subpixel
         self._create_vertex_list()
 
+    def _get_program(self, img: AbstractImage | Animation) -> ShaderProgram:
+        # Called once from `__init__`; the result is stored in `_program`, which the
+        # `program` property returns. Later image changes do not call this again.
+        if isinstance(img, image.TextureArrayRegion):
+            return get_default_array_shader()
+        return get_default_shader()
+
     @property
     def program(self) -> ShaderProgram:
-        if isinstance(self._img, image.TextureArrayRegion):
-            program = get_default_array_shader()
-        else:
-            program = get_default_shader()
-
-        return program
+        """The ShaderProgram used to draw the sprite."""
+        return self._program
 
     def __del__(self):
         try:
             if self._vertex_list is not None:
                 self._vertex_list.delete()
-        except:
+        except Exception:
+            # Partially initialized sprite, or GL objects already gone on interpreter shutdown
             pass
 
     def delete(self) -> None:
@@ -334,19 +356,22 @@ class Sprite(event.EventDispatcher):
         self._group = None
 
     def _animate(self, dt: float) -> None:
+        frames = self._animation.frames
         self._frame_index += 1
-        if self._frame_index >= len(self._animation.frames):
+        if self._frame_index >= len(frames):
             self._frame_index = 0
             self.dispatch_event('on_animation_end')
             if self._vertex_list is None:
                 return  # Deleted in event handler.
+            frames = self._animation.frames  # The handler may have changed the image.
 
-        frame = self._animation.frames[self._frame_index]
+        frame = frames[self._frame_index]
         self._set_texture(frame.image.get_texture())
 
-        if frame.duration is not None:
-            duration = frame.duration - (self._next_dt - dt)
-            duration = min(max(0, duration), frame.duration)
+        frame_duration = frame.duration
+        if frame_duration is not None:
+            duration = frame_duration - (self._next_dt - dt)
+            duration = min(max(0, duration), frame_duration)
             clock.schedule_once(self._animate, duration)
             self._next_dt = duration
         else:
@@ -421,7 +446,8 @@ class Sprite(event.EventDispatcher):
         self._update_position()
 
     def _set_texture(self, texture: Texture) -> None:
-        if texture.id is not self._texture.id:
+        # Regions of the same texture (e.g. atlas or grid frames) can share the current group
+        if texture.id != self._texture.id or texture.target != self._texture.target:
             self._group = self._group.__class__(texture,
                                                 self._group.blend_src,
                                                 self._group.blend_dest,
@@ -436,7 +462,7 @@ class Sprite(event.EventDispatcher):
 
     def _create_vertex_list(self) -> None:
         self._vertex_list = self.program.vertex_list_indexed(
-            4, GL_TRIANGLES, [0, 1, 2, 0, 2, 3], self._batch, self._group,
+            4, GL_TRIANGLES, _QUAD_INDICES, self._batch, self._group,
             position=('f', self._get_vertices()),
             colors=('Bn', (*self._rgb, int(self._opacity)) * 4),
             translate=('f', (self._x, self._y, self._z) * 4),
@@ -446,23 +472,36 @@ class Sprite(event.EventDispatcher):
 
     def _get_vertices(self) -> tuple:
         if not self._visible:
-            return 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+            return _HIDDEN_VERTICES
         else:
             img = self._texture
             x1 = -img.anchor_x
             y1 = -img.anchor_y
             x2 = x1 + img.width
             y2 = y1 + img.height
-            vertices = (x1, y1, 0, x2, y1, 0, x2, y2, 0, x1, y2, 0)
 
             if not self._subpixel:
-                return tuple(map(int, vertices))
-            else:
-                return vertices
+                x1 = int(x1)
+                y1 = int(y1)
+                x2 = int(x2)
+                y2 = int(y2)
+
+            return x1, y1, 0, x2, y1, 0, x2, y2, 0, x1, y2, 0
 
     def _update_position(self) -> None:
         self._vertex_list.position[:] = self._get_vertices()
 
+    def _update_translate(self) -> None:
+        self._vertex_list.translate[:] = (self._x, self._y, self._z) * 4
+
+    def _update_color(self) -> None:
+        r, g, b = self._rgb
+        self._vertex_list.colors[:] = (r, g, b, int(self._opacity)) * 4
+
+    def _update_scale(self) -> None:
+        scale = self._scale
+        self._vertex_list.scale[:] = (scale * self._scale_x, scale * self._scale_y) * 4
+
     @property
     def position(self) -> tuple[float, float, float]:
         """The (x, y, z) coordinates of the sprite, as a tuple."""
@@ -470,8 +509,11 @@ class Sprite(event.EventDispatcher):
 
     @position.setter
     def position(self, position: tuple[float, float, float]) -> None:
-        self._x, self._y, self._z = position
-        self._vertex_list.translate[:] = position * 4
+        x, y, z = position
+        if x == self._x and y == self._y and z == self._z:
+            return
+        self._x, self._y, self._z = x, y, z
+        self._update_translate()
 
     @property
     def x(self) -> float:
@@ -480,8 +522,10 @@ class Sprite(event.EventDispatcher):
 
     @x.setter
     def x(self, x):
+        if x == self._x:
+            return
         self._x = x
-        self._vertex_list.translate[:] = (x, self._y, self._z) * 4
+        self._update_translate()
 
     @property
     def y(self) -> float:
@@ -490,8 +534,10 @@ class Sprite(event.EventDispatcher):
 
     @y.setter
     def y(self, y):
+        if y == self._y:
+            return
         self._y = y
-        self._vertex_list.translate[:] = (self._x, y, self._z) * 4
+        self._update_translate()
 
     @property
     def z(self) -> float:
@@ -500,8 +546,10 @@ class Sprite(event.EventDispatcher):
 
     @z.setter
     def z(self, z):
+        if z == self._z:
+            return
         self._z = z
-        self._vertex_list.translate[:] = (self._x, self._y, z) * 4
+        self._update_translate()
 
     @property
     def rotation(self) -> float:
@@ -514,6 +562,8 @@ class Sprite(event.EventDispatcher):
 
     @rotation.setter
     def rotation(self, rotation: float):
+        if rotation == self._rotation:
+            return
         self._rotation = rotation
         self._vertex_list.rotation[:] = (self._rotation,) * 4
 
@@ -528,8 +578,10 @@ class Sprite(event.EventDispatcher):
 
     @scale.setter
     def scale(self, scale):
+        if scale == self._scale:
+            return
         self._scale = scale
-        self._vertex_list.scale[:] = (scale * self._scale_x, scale * self._scale_y) * 4
+        self._update_scale()
 
     @property
     def scale_x(self) -> float:
@@ -542,8 +594,10 @@ class Sprite(event.EventDispatcher):
 
     @scale_x.setter
     def scale_x(self, scale_x):
+        if scale_x == self._scale_x:
+            return
         self._scale_x = scale_x
-        self._vertex_list.scale[:] = (self._scale * scale_x, self._scale * self._scale_y) * 4
+        self._update_scale()
 
     @property
     def scale_y(self):
@@ -556,8 +610,10 @@ class Sprite(event.EventDispatcher):
 
     @scale_y.setter
     def scale_y(self, scale_y):
+        if scale_y == self._scale_y:
+            return
         self._scale_y = scale_y
-        self._vertex_list.scale[:] = (self._scale * self._scale_x, self._scale * scale_y) * 4
+        self._update_scale()
 
     def update(self, x: float | None = None, y: float | None = None, z: float | None = None,
                rotation: float | None = None, scale: float | None = None,
@@ -587,18 +643,18 @@ class Sprite(event.EventDispatcher):
         translations_outdated = False
 
         # only bother updating if the translation actually changed
-        if x is not None:
+        if x is not None and x != self._x:
             self._x = x
             translations_outdated = True
-        if y is not None:
+        if y is not None and y != self._y:
             self._y = y
             translations_outdated = True
-        if z is not None:
+        if z is not None and z != self._z:
             self._z = z
             translations_outdated = True
 
         if translations_outdated:
-            self._vertex_list.translate[:] = (self._x, self._y, self._z) * 4
+            self._update_translate()
 
         if rotation is not None and rotation != self._rotation:
             self._rotation = rotation
@@ -607,18 +663,18 @@ class Sprite(event.EventDispatcher):
         scales_outdated = False
 
         # only bother updating if the scale actually changed
-        if scale is not None:
+        if scale is not None and scale != self._scale:
             self._scale = scale
             scales_outdated = True
-        if scale_x is not None:
+        if scale_x is not None and scale_x != self._scale_x:
             self._scale_x = scale_x
             scales_outdated = True
-        if scale_y is not None:
+        if scale_y is not None and scale_y != self._scale_y:
             self._scale_y = scale_y
             scales_outdated = True
 
         if scales_outdated:
-            self._vertex_list.scale[:] = (self._scale * self._scale_x, self._scale * self._scale_y) * 4
+            self._update_scale()
 
     @property
     def width(self) -> float:
@@ -662,8 +718,10 @@ class Sprite(event.EventDispatcher):
 
     @opacity.setter
     def opacity(self, opacity: int):
+        if opacity == self._opacity:
+            return
         self._opacity = opacity
-        self._vertex_list.colors[:] = (*self._rgb, int(self._opacity)) * 4
+        self._update_color()
 
     @property
     def color(self) -> tuple[int, int, int]:
@@ -679,8 +737,11 @@ class Sprite(event.EventDispatcher):
 
     @color.setter
     def color(self, rgb: tuple[int, int, int]):
-        self._rgb = int(rgb[0]), int(rgb[1]), int(rgb[2])
-        self._vertex_list.colors[:] = (*self._rgb, int(self._opacity)) * 4
+        rgb = int(rgb[0]), int(rgb[1]), int(rgb[2])
+        if rgb == self._rgb:
+            return
+        self._rgb = rgb
+        self._update_color()
 
     @property
     def visible(self) -> bool:
@@ -689,6 +750,8 @@ class Sprite(event.EventDispatcher):
 
     @visible.setter
     def visible(self, visible):
+        if visible == self._visible:
+            return
         self._visible = visible
         self._update_position()
 
@@ -769,15 +832,11 @@ class AdvancedSprite(pyglet.sprite.Sprite):
                  program=None):
 
         self._program = program
-
-        if not program:
-            if isinstance(img, image.TextureArrayRegion):
-                self._program = get_default_array_shader()
-            else:
-                self._program = get_default_shader()
-
         super().__init__(img, x, y, z, blend_src, blend_dest, batch, group, subpixel)
 
+    def _get_program(self, img: AbstractImage | Animation) -> ShaderProgram:
+        return self._program or super()._get_program(img)
+
     @property
     def program(self) -> ShaderProgram:
         return self._program
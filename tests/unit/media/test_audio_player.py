@@ -0,0 +1,59 @@
+import pytest
+
+from pyglet.media.codecs.base import AudioFormat
+from pyglet.media.drivers.base import AbstractAudioPlayer, MediaEvent
+
+
+class DummySource:
+    audio_format = AudioFormat(1, 8, 1000)  # 1000 bytes per second
+
+
+class DummyPlayer:
+    pass
+
+
+class DummyAudioPlayer(AbstractAudioPlayer):
+    def prefill_audio(self): pass
+    def work(self): pass
+    def play(self): pass
+    def stop(self): pass
+    def clear(self): pass
+    def delete(self): pass
+    def get_play_cursor(self): return 0
+
+
+@pytest.fixture
+def audio_player():
+    # The audio player only holds proxies, so keep the referents alive while it is in use.
+    source, player = DummySource(), DummyPlayer()
+    yield DummyAudioPlayer(source, player)
+
+
+def test_time_until_refill_without_events(audio_player):
+    assert audio_player.get_time_until_work(100, 600) == pytest.approx(0.5)
+
+
+def test_time_until_event_before_refill(audio_player):
+    audio_player._events.append((300, MediaEvent('on_eos')))
+    audio_player._compensated_bytes = -50
+    assert audio_player.get_time_until_work(100, 600) == pytest.approx(0.15)
+
+
+def test_time_until_refill_before_event(audio_player):
+    audio_player._events.append((900, MediaEvent('on_eos')))
+    assert audio_player.get_time_until_work(100, 600) == pytest.approx(0.5)
+
+
+def test_time_until_event_without_refill(audio_player):
+    audio_player._events.append((400, MediaEvent('on_eos')))
+    assert audio_player.get_time_until_work(100) == pytest.approx(0.3)
+
+
+def test_time_until_work_is_none_without_target(audio_player):
+    assert audio_player.get_time_until_work(100) is None
+
+
+def test_time_until_work_is_clamped_when_overdue(audio_player):
+    assert audio_player.get_time_until_work(700, 600) == 0
+    audio_player._events.append((200, MediaEvent('on_eos')))
+    assert audio_player.get_time_until_work(700) == 0
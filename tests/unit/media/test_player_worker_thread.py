@@ -0,0 +1,73 @@
+import threading
+import time
+
+import pytest
+
+from pyglet.media.player_worker_thread import PlayerWorkerThread
+
+
+class DummyAudioPlayer:
+    def __init__(self, next_work=None):
+        self.next_work = next_work
+        self.work_count = 0
+        self.worked = threading.Event()
+
+    def work(self):
+        self.work_count += 1
+        self.worked.set()
+        return self.next_work
+
+
+@pytest.fixture
+def worker():
+    worker = PlayerWorkerThread()
+    worker.start()
+    yield worker
+    worker.stop()
+
+
+def test_stop_terminates_thread():
+    worker = PlayerWorkerThread()
+    worker.start()
+    worker.stop()
+    assert not worker.is_alive()
+
+
+def test_added_player_is_worked(worker):
+    player = DummyAudioPlayer()
+    worker.add(player)
+    assert player.worked.wait(1.0)
+    assert player in worker.players
+
+
+def test_removed_player_is_not_worked(worker):
+    player = DummyAudioPlayer()
+    worker.add(player)
+    assert player.worked.wait(1.0)
+
+    worker.remove(player)
+    assert player not in worker.players
+    count = player.work_count
+    time.sleep(worker._nap_time * 3)
+    assert player.work_count == count
+
+
+def test_remove_unknown_player(worker):
+    worker.remove(DummyAudioPlayer())
+    assert not worker.players
+
+
+def test_add_player_twice(worker):
+    player = DummyAudioPlayer()
+    worker.add(player)
+    worker.add(player)
+    assert worker.players == {player}
+    assert player.worked.wait(1.0)
+
+
+def test_player_next_work_hint_is_capped(worker):
+    player = DummyAudioPlayer(next_work=1000.0)
+    worker.add(player)
+    assert player.worked.wait(1.0)
+    player.worked.clear()
+    assert player.worked.wait(worker._max_nap_time * 5)
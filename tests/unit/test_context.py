@@ -0,0 +1,13 @@
+from unittest import mock
+
+from pyglet.gl.base import Context
+
+
+@mock.patch('pyglet.graphics.shader.Shader')
+@mock.patch('pyglet.graphics.shader.ShaderProgram')
+def test_create_program_caches_sequence_sources(mock_program, mock_shader):
+    context = Context(config=None)
+
+    program = context.create_program(['vertex src', 'vertex'], ['fragment src', 'fragment'])
+    assert context.create_program(('vertex src', 'vertex'), ('fragment src', 'fragment')) is program
+    assert mock_program.call_count == 1
@@ -3,6 +3,8 @@ from unittest.mock import MagicMock
 import pytest
 import pyglet
 
+from pyglet.gl import GL_TEXTURE_2D
+
 
 @pytest.fixture(autouse=True)
 def monkeypatch_default_sprite_shader(monkeypatch, get_dummy_shader_program):
@@ -127,3 +129,152 @@ def test_update_sets_rotation_when_passed(sprite):
 def test_update_leaves_rotation_alone_when_none(sprite):
     sprite.update()
     assert sprite.rotation == 90
+
+
+def test_position_setters_write_translate(sprite):
+    sprite.x = 4
+    sprite.y = 5
+    sprite.position = (6, 7, 8)
+    sprite.z = 9
+
+    writes = [c.args[1] for c in sprite._vertex_list.translate.__setitem__.call_args_list]
+    assert writes == [(4, 2, 3) * 4, (4, 5, 3) * 4, (6, 7, 8) * 4, (6, 7, 9) * 4]
+
+
+def test_vertices_are_truncated_without_subpixel():
+    img = MagicMock(anchor_x=0.5, anchor_y=1.5, width=10.7, height=20.2)
+    img.get_texture.return_value = img
+    sprite = pyglet.sprite.Sprite(img)
+    assert sprite._get_vertices() == (0, -1, 0, 10, -1, 0, 10, 18, 0, 0, 18, 0)
+
+    sprite = pyglet.sprite.Sprite(img, subpixel=True)
+    assert sprite._get_vertices() == pytest.approx((-0.5, -1.5, 0, 10.2, -1.5, 0, 10.2, 18.7, 0, -0.5, 18.7, 0))
+
+
+def test_hidden_sprite_has_zero_vertices(sprite):
+    sprite.visible = False
+    assert sprite._get_vertices() == (0,) * 12
+
+
+def test_setting_unchanged_values_skips_vertex_writes(sprite):
+    vertex_list = sprite._vertex_list
+    vertex_list.reset_mock()
+
+    sprite.position = (1, 2, 3)
+    sprite.x, sprite.y, sprite.z = 1, 2, 3
+    sprite.rotation = 90
+    sprite.scale = sprite.scale_x = sprite.scale_y = 1.0
+    sprite.opacity = 255
+    sprite.color = (255, 255, 255)
+    sprite.visible = True
+    sprite.update(x=1, y=2, z=3, rotation=90, scale=1.0, scale_x=1.0, scale_y=1.0)
+
+    assert not vertex_list.translate.__setitem__.called
+    assert not vertex_list.rotation.__setitem__.called
+    assert not vertex_list.scale.__setitem__.called
+    assert not vertex_list.colors.__setitem__.called
+    assert not vertex_list.position.__setitem__.called
+
+
+def test_scale_setters_write_combined_scale(sprite):
+    sprite.scale = 2.0
+    sprite.scale_x = 3.0
+    sprite.scale_y = 4.0
+    sprite.update(scale=0.5)
+
+    writes = [c.args[1] for c in sprite._vertex_list.scale.__setitem__.call_args_list]
+    assert writes == [(2.0, 2.0) * 4, (6.0, 2.0) * 4, (6.0, 8.0) * 4, (1.5, 2.0) * 4]
+
+
+def test_color_and_opacity_write_rgba(sprite):
+    sprite.color = (1.0, 2.0, 3.0)
+    sprite.opacity = 128.0
+
+    writes = [c.args[1] for c in sprite._vertex_list.colors.__setitem__.call_args_list]
+    assert writes == [(1, 2, 3, 255) * 4, (1, 2, 3, 128) * 4]
+
+
+def test_set_texture_with_region_of_same_texture_keeps_vertex_list(sprite):
+    texture = pyglet.image.Texture(64, 64, GL_TEXTURE_2D, 1000)
+    first, second = texture.get_region(0, 0, 32, 32), texture.get_region(32, 0, 32, 32)
+    sprite._texture = first
+    group = sprite._group
+    vertex_list = sprite._vertex_list
+
+    sprite._set_texture(second)
+
+    assert sprite._group is group
+    assert sprite._vertex_list is vertex_list
+    assert not vertex_list.delete.called
+    vertex_list.tex_coords.__setitem__.assert_called_once_with(slice(None), second.tex_coords)
+
+
+def test_program_is_resolved_once(monkeypatch):
+    get_shader = MagicMock()
+    monkeypatch.setattr('pyglet.sprite.get_default_shader', get_shader)
+    sprite = pyglet.sprite.Sprite(MagicMock())
+
+    assert sprite.program is get_shader.return_value
+    assert sprite.program is get_shader.return_value
+    get_shader.assert_called_once_with()
+
+
+def test_advanced_sprite_uses_given_program(monkeypatch):
+    get_shader = MagicMock()
+    monkeypatch.setattr('pyglet.sprite.get_default_shader', get_shader)
+    program = MagicMock()
+    sprite = pyglet.sprite.AdvancedSprite(MagicMock(), program=program)
+
+    assert sprite.program is program
+    assert sprite._group.program is program
+    assert not get_shader.called
+
+
+def test_animate_advances_and_loops():
+    frames = [pyglet.image.AnimationFrame(MagicMock(), 0.1) for _ in range(2)]
+    sprite = pyglet.sprite.Sprite(pyglet.image.Animation(frames))
+    ended = MagicMock()
+    sprite.push_handlers(on_animation_end=ended)
+
+    sprite._animate(0.1)
+    assert sprite.frame_index == 1
+    assert not ended.called
+
+    sprite._animate(0.1)
+    assert sprite.frame_index == 0
+    ended.assert_called_once_with()
+
+    sprite.delete()
+
+
+def test_subclass_without_sprite_init_uses_class_defaults():
+    class CustomSprite(pyglet.sprite.AdvancedSprite):
+        # Like the MultiTextureSprite examples, only set up the state it needs.
+        def __init__(self, texture, program):
+            self._x = self._y = self._z = 0
+            self._program = program
+            self._texture = texture
+            self._batch = None
+            self._group = MagicMock()
+            self._subpixel = False
+            self._create_vertex_list()
+
+    program = MagicMock()
+    sprite = CustomSprite(pyglet.image.Texture(16, 16, GL_TEXTURE_2D, 1), program)
+
+    assert sprite._vertex_list is program.vertex_list_indexed.return_value
+    assert sprite.visible and sprite.opacity == 255 and sprite.scale == 1.0
+
+
+def test_program_property_override_is_used():
+    custom_program = MagicMock()
+
+    class CustomSprite(pyglet.sprite.Sprite):
+        @property
+        def program(self):
+            return custom_program
+
+    sprite = CustomSprite(MagicMock())
+
+    assert sprite._group.program is custom_program
+    assert sprite._vertex_list is custom_program.vertex_list_indexed.return_value